@@ -0,0 +1,36 @@
+"""cover category and amount in posted_date index
+
+Revision ID: 4dd2791a4ccd
+Revises: 7baf6a11f8b7
+Create Date: 2026-10-15 10:03:27.540118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4dd2791a4ccd'
+down_revision: Union[str, Sequence[str], None] = '7baf6a11f8b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Monthly category totals filter on posted_date and read only category
+    # and amount, so carrying them in the index allows index-only scans
+    op.drop_index('idx_transactions_posted_date', table_name='transactions')
+    op.create_index(
+        'idx_transactions_posted_date',
+        'transactions',
+        ['posted_date'],
+        postgresql_include=['category', 'amount'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transactions_posted_date', table_name='transactions')
+    op.create_index('idx_transactions_posted_date', 'transactions', ['posted_date'])
@@ -0,0 +1,34 @@
+"""add (posted_date, abs(amount)) index
+
+Revision ID: 7baf6a11f8b7
+Revises: 3d12f4ed5370
+Create Date: 2026-10-15 09:12:41.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7baf6a11f8b7'
+down_revision: Union[str, Sequence[str], None] = '3d12f4ed5370'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # "Top N by ABS(amount)" filters on one month first, so the month
+    # range leads the key; abs(amount) follows for the per-month ordering
+    op.create_index(
+        'idx_transactions_posted_date_abs_amount',
+        'transactions',
+        ['posted_date', sa.text('abs(amount) DESC')],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transactions_posted_date_abs_amount', table_name='transactions')
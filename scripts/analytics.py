@@ -15,14 +15,16 @@ What it does:
     5. Shows top transactions for the month
 """
 
+import json
+
 import psycopg2
-from datetime import datetime, UTC
+from psycopg2.extras import execute_values
 from pathlib import Path
 
 from spendsense.config.settings import settings
-from spendsense.io.csv import load_transactions_csv
+from spendsense.io.csv import iter_transactions_csv
 from spendsense.utils.hashing import compute_dedupe_hash
-from spendsense.utils.dates import normalize_date
+from spendsense.utils.dates import month_bounds
 
 
 def get_db_connection():
@@ -30,35 +32,124 @@ def get_db_connection():
     return psycopg2.connect(settings.database_url)
 
 
-def import_to_db(csv_path: Path):
-    """Import categorized transactions to database with new schema.
+# Multi-row insert used by import_to_db; execute_values expands VALUES %s
+INSERT_TRANSACTIONS_SQL = """
+    INSERT INTO transactions (posted_date, amount, description, merchant, category, statement_id, dedupe_hash)
+    VALUES %s
+    ON CONFLICT (dedupe_hash) DO NOTHING
+"""
+
+
+def iter_insert_rows(transactions):
+    """Yield insert rows for transactions one at a time.
     
     Args:
-        csv_path: Path to the categorized CSV file
+        transactions: Iterable of transaction dictionaries as produced by
+            iter_transactions_csv (ISO dates, float amounts)
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Load transactions from CSV
-    transactions = load_transactions_csv(csv_path)
-
-    
-    # Transform and insert each transaction
     for txn in transactions:
-        posted_date = normalize_date(txn["date"])
-        amount = float(txn["amount"])
+        posted_date = txn["date"]
+        amount = txn["amount"]
         description = txn["description"]
-        merchant = txn.get("merchant", "Unknown")
         dedupe_hash = compute_dedupe_hash(posted_date, amount, description)
-        
-        cursor.execute("""
-            INSERT INTO transactions (posted_date, amount, description, merchant, category, statement_id, dedupe_hash)
-            VALUES (%s, %s, %s, %s, %s, NULL, %s)
-            ON CONFLICT (dedupe_hash) DO NOTHING
-        """, (posted_date, amount, description, merchant, category, dedupe_hash))
+        yield (
+            posted_date,
+            amount,
+            description,
+            txn.get("merchant", "Unknown"),
+            txn.get("category"),
+            dedupe_hash,
+        )
+
+
+def _import_cache_path() -> Path:
+    return settings.DATA_DIR / "import_cache.json"
+
+
+def _load_import_cache() -> dict:
+    path = _import_cache_path()
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save_import_cache(cache: dict) -> None:
+    path = _import_cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def _file_signature(csv_path: Path) -> list[int]:
+    stat = csv_path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def import_to_db(csv_path: Path, conn=None):
+    """Import categorized transactions to database with new schema.
+    
+    Re-importing an unchanged CSV is skipped: the file's mtime and size are
+    remembered along with the dedupe hash of its last row, and if both still
+    match (and that row is in the table) there is nothing new to insert.
+    
+    Args:
+        csv_path: Path to the categorized CSV file
+        conn: Open connection to reuse (a new one is opened and closed if omitted)
+    """
+    csv_path = Path(csv_path)
+    cache_key = str(csv_path.resolve())
+    signature = _file_signature(csv_path)
+    import_cache = _load_import_cache()
+    cached = import_cache.get(cache_key)
     
-    conn.commit()
-    conn.close()
+    last_hash = None
+
+    def track_last_hash(rows):
+        nonlocal last_hash
+        for row in rows:
+            last_hash = row[-1]
+            yield row
+
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_db_connection()
+    try:
+        # One explicit transaction for the whole import: a single commit on
+        # success, rolled back if any page fails
+        with conn, conn.cursor() as cursor:
+            if cached and cached["signature"] == signature:
+                cursor.execute(
+                    "SELECT 1 FROM transactions WHERE dedupe_hash = %s",
+                    (cached["last_hash"],),
+                )
+                if cursor.fetchone():
+                    return
+
+            # The import is re-runnable (ON CONFLICT DO NOTHING) and the CSV
+            # stays the source of truth, so don't wait for the WAL flush on
+            # commit. SET LOCAL only affects this transaction.
+            cursor.execute("SET LOCAL synchronous_commit = off")
+
+            # Stream transactions from CSV so rows are inserted as they are parsed
+            transactions = iter_transactions_csv(csv_path)
+
+            # Insert with multi-row VALUES statements instead of one round-trip per row.
+            # Rows are generated lazily and consumed one page at a time.
+            execute_values(
+                cursor,
+                INSERT_TRANSACTIONS_SQL,
+                track_last_hash(iter_insert_rows(transactions)),
+                template="(%s, %s, %s, %s, %s, NULL, %s)",
+                page_size=1000,
+            )
+    finally:
+        if owns_conn:
+            conn.close()
+
+    if last_hash is not None:
+        import_cache[cache_key] = {"signature": signature, "last_hash": last_hash}
+        _save_import_cache(import_cache)
 
 
 def get_category_totals(conn):
@@ -74,12 +165,30 @@ def get_category_totals(conn):
 
 
 def get_months(conn):
-    """Get available months in the transactions table."""
+    """Get available months in the transactions table.
+    
+    Walks the posted_date index one month at a time (a recursive "skip
+    scan"): each step jumps to the first date on or after the next month,
+    so the cost is one index probe per month instead of a full table scan.
+    """
     cursor = conn.cursor()
     cursor.execute("""
-                    SELECT DISTINCT to_char(posted_date, 'YYYY-MM') AS month
-                    FROM transactions
-                    ORDER BY month
+                    WITH RECURSIVE months AS (
+                        SELECT date_trunc('month', MIN(posted_date))::date AS month_start
+                        FROM transactions
+                        UNION ALL
+                        SELECT (
+                            SELECT date_trunc('month', MIN(t.posted_date))::date
+                            FROM transactions t
+                            WHERE t.posted_date >= (months.month_start + INTERVAL '1 month')::date
+                        )
+                        FROM months
+                        WHERE months.month_start IS NOT NULL
+                    )
+                    SELECT to_char(month_start, 'YYYY-MM') AS month
+                    FROM months
+                    WHERE month_start IS NOT NULL
+                    ORDER BY month_start
                    """)
     return [row[0] for row in cursor.fetchall()]
 
@@ -93,19 +202,50 @@ def get_monthly_totals(conn):
                    GROUP BY month
                    ORDER BY month
                    """)
-    return [(row[0],row[1]) for row in cursor.fetchall()]
+    return cursor.fetchall()
 
 
 def get_transactions_for_month(conn, month):
-    """Get all transactions for a given month."""
+    """Get all transactions for a given month.
+    
+    Returns:
+        List of (posted_date, description, amount, category) tuples
+    """
     cursor = conn.cursor()
     cursor.execute("""
                     SELECT posted_date, description, amount, category
                     FROM transactions
-                    WHERE to_char(posted_date, 'YYYY-MM') = %s
+                    WHERE posted_date >= %s AND posted_date < %s
                     ORDER BY posted_date
-                   """, (month,))
-    return [(row[0],row[1],row[2],row[3]) for row in cursor.fetchall()]
+                   """, month_bounds(month))
+    # psycopg2 rows are already tuples; no need to repack them
+    return cursor.fetchall()
+
+
+def get_month_breakdown(conn, month):
+    """Get total spent, transaction count and category totals for a month.
+    
+    A single ROLLUP query returns the per-category totals plus the grand
+    total row, so the month is scanned once.
+    
+    Returns:
+        Tuple of (total, transaction count, list of (category, total) rows)
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+                    SELECT category, COALESCE(SUM(amount), 0) AS total, COUNT(*),
+                           GROUPING(category) AS is_grand_total
+                    FROM transactions
+                    WHERE posted_date >= %s AND posted_date < %s
+                    GROUP BY ROLLUP (category)
+                    ORDER BY is_grand_total DESC, total DESC
+                   """, month_bounds(month))
+    rows = cursor.fetchall()
+    # The grand total row sorts first; it is present even for an empty month
+    _, selected_total, txn_count, _ = rows[0]
+    cat_totals = [(category, total) for category, total, _, _ in rows[1:]]
+    return selected_total, txn_count, cat_totals
+
 
 def get_category_totals_for_month(conn, month):
     """Get category totals for a specific month."""
@@ -113,11 +253,11 @@ def get_category_totals_for_month(conn, month):
     cursor.execute("""
                     SELECT category, SUM(amount) AS total
                     FROM transactions
-                    WHERE to_char(posted_date, 'YYYY-MM') = %s
+                    WHERE posted_date >= %s AND posted_date < %s
                     GROUP BY category
                     ORDER BY total DESC
-                   """, (month,))
-    return [(row[0],row[1]) for row in cursor.fetchall()]
+                   """, month_bounds(month))
+    return cursor.fetchall()
 
 
 def get_biggest_transactions(conn, month, limit=5):
@@ -126,10 +266,10 @@ def get_biggest_transactions(conn, month, limit=5):
     cursor.execute("""
                     SELECT posted_date, merchant, amount, category
                     FROM transactions
-                    WHERE to_char(posted_date, 'YYYY-MM') = %s
+                    WHERE posted_date >= %s AND posted_date < %s
                     ORDER BY ABS(amount) DESC
                     LIMIT %s
-                   """, (month, limit))
+                   """, (*month_bounds(month), limit))
     return cursor.fetchall()
 
 
@@ -152,8 +292,9 @@ def run_analytics(csv_path: Path) -> bool:
         
         # Import data
         print("\nImporting transactions to database...")
-        import_to_db(csv_path)
+        # One connection serves both the import and the analytics queries
         conn = get_db_connection()
+        import_to_db(csv_path, conn)
         
         # Print available months
         months = get_months(conn)
@@ -181,13 +322,11 @@ def run_analytics(csv_path: Path) -> bool:
         print("=" * 60)
 
         # Total spent in the selected month
-        month_txns = get_transactions_for_month(conn, current_month)
-        selected_total = sum(txn[2] for txn in month_txns)
+        selected_total, txn_count, cat_totals = get_month_breakdown(conn, current_month)
         print(f"\n💰 Total spent: ${selected_total:.2f}")
-        print(f"📝 Transactions: {len(month_txns)}")
+        print(f"📝 Transactions: {txn_count}")
 
         # Category totals for the selected month
-        cat_totals = get_category_totals_for_month(conn, current_month)
         print("\n📂 Category breakdown:")
         if cat_totals:
             name_width = max(len(str(c[0] or "")) for c in cat_totals)
@@ -14,8 +14,6 @@ Example:
 
 import argparse
 import sys
-import time
-import json
 from pathlib import Path
 from typing import Optional
 from collections import Counter
@@ -28,12 +26,12 @@ from spendsense.services.pdf_processor import (
 )
 
 # Import LLM service for categorization
-from spendsense.services.llm import LLMService
-from spendsense.services.prompts import build_category_prompt
-from spendsense.core.constants import CATEGORIES
+from spendsense.services.llm import get_llm_service
+from spendsense.services.categorizer import categorize_transactions
 
 # Import CSV utilities
 from spendsense.io.csv import write_transactions_csv
+from spendsense.utils.merchant import clean_merchant_name
 
 
 def process_and_categorize_pdf(
@@ -81,44 +79,31 @@ def process_and_categorize_pdf(
     
     # Step 4: Categorize transactions using LLM
     print("\n[4/4] 🤖 Categorizing transactions with AI...")
-    llm = LLMService()
+    llm = get_llm_service()
+    category_counts = Counter()
     
     try:
         categorized = []
         total = len(transactions)
         idx_width = len(str(total))
         
-        for i, transaction in enumerate(transactions, start=1):
+        results = categorize_transactions(transactions, llm)
+        
+        for i, (transaction, result) in enumerate(zip(transactions, results), start=1):
             description = transaction["description"]
-            amount = float(transaction["amount"])  # Convert string to float
-            
-            # Build categorization prompt (now asks for category AND merchant)
-            prompt = build_category_prompt(description, amount, CATEGORIES)
-            response = llm.ask(prompt)
-            
-            # Parse JSON response
-            try:
-                # Try to parse as JSON
-                data = json.loads(response)
-                category = data.get("category", "Others")
-                merchant = data.get("merchant", "Unknown")
-            except json.JSONDecodeError:
-                # Fallback: if LLM didn't return JSON, treat as category only
-                category = response.strip()
-                merchant = "Unknown"
+            amount = transaction["amount"]
+            category = result["category"]
+            merchant = result["merchant"]
             
             # Add category and merchant to transaction
             transaction["category"] = category
             transaction["merchant"] = merchant
             categorized.append(transaction)
+            category_counts[category] += 1
             
             # Show progress
             short_desc = (description[:50] + "…") if len(description) > 50 else description
             print(f"      [{i:>{idx_width}}/{total}] {category:<16} {merchant:<20} ${amount:>8.2f}")
-            
-            # Rate limiting to avoid API throttling
-            if i < total:
-                time.sleep(0.5)
         
         transactions = categorized
         print(f"\n      ✓ Categorized {len(transactions)} transactions")
@@ -126,10 +111,11 @@ def process_and_categorize_pdf(
     except Exception as e:
         print(f"\nCategorization failed: {e}")
         print("      Proceeding without categories...")
-        # Add empty category and merchant fields
+        category_counts.clear()
+        # Add empty category; derive the merchant from the description
         for transaction in transactions:
             transaction["category"] = ""
-            transaction["merchant"] = ""
+            transaction["merchant"] = clean_merchant_name(transaction["description"])
     
     # Step 5: Write to CSV
     if output_csv is None:
@@ -145,12 +131,10 @@ def process_and_categorize_pdf(
     print(f"   • Total transactions: {len(transactions)}")
     
     # Show category breakdown if categorization succeeded
-    if transactions and transactions[0].get("category"):
-        category_counts = Counter(t.get("category", "Unknown") for t in transactions)
-        
+    if category_counts:
         print(f"   • Categories found: {len(category_counts)}")
         print(f"\n   Category breakdown:")
-        for cat, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
+        for cat, count in category_counts.most_common():
             print(f"     - {cat:<20} {count:>3} transactions")
     
     print("=" * 60)
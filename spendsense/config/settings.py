@@ -19,11 +19,7 @@ from functools import lru_cache
 # Project root (two levels up from this file)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
-# Load .env file in local development (before reading env vars)
 _dotenv_path = PROJECT_ROOT / ".env"
-if _dotenv_path.exists():
-    from dotenv import load_dotenv
-    load_dotenv(_dotenv_path)
 
 
 @dataclass(frozen=True)
@@ -39,6 +35,8 @@ class Settings:
     HIGH_COST_MODEL: str  # For complex tasks (if needed)
     OPENAI_BASE_URL: str
     OPENAI_TIMEOUT: int
+    OPENAI_MAX_CONCURRENCY: int  # Parallel in-flight requests when categorizing
+    OPENAI_BATCH_SIZE: int  # Transactions categorized per request
     
     # =========================================================================
     # Database
@@ -52,6 +50,11 @@ class Settings:
     PG_PASSWORD: str
     PG_DATABASE: str
     
+    # =========================================================================
+    # OCR
+    # =========================================================================
+    OCR_MAX_WORKERS: int  # Pages OCR'd in parallel (0 = one per CPU)
+    
     # =========================================================================
     # Paths
     # =========================================================================
@@ -89,12 +92,21 @@ class Settings:
 @lru_cache(maxsize=1)
 def _load_settings() -> Settings:
     """Load settings from environment. Cached for performance."""
+    # Load .env file in local development (before reading env vars)
+    if _dotenv_path.exists():
+        from dotenv import load_dotenv
+        load_dotenv(_dotenv_path)
+    
     return Settings(
         # OpenAI
         OPENAI_API_KEY=os.getenv("OPENAI_API_KEY", ""),
         OPENAI_MODEL=os.getenv("OPENAI_MODEL", ""),
+        LOW_COST_MODEL=os.getenv("LOW_COST_MODEL", ""),
+        HIGH_COST_MODEL=os.getenv("HIGH_COST_MODEL", ""),
         OPENAI_BASE_URL=os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1/chat/completions"),
         OPENAI_TIMEOUT=int(os.getenv("OPENAI_TIMEOUT", "60")),
+        OPENAI_MAX_CONCURRENCY=int(os.getenv("OPENAI_MAX_CONCURRENCY", "8")),
+        OPENAI_BATCH_SIZE=int(os.getenv("OPENAI_BATCH_SIZE", "20")),
         
         # Database
         DATABASE_URL=os.getenv("DATABASE_URL", ""),
@@ -103,8 +115,26 @@ def _load_settings() -> Settings:
         PG_USER=os.getenv("PG_USER", "postgres"),
         PG_PASSWORD=os.getenv("PG_PASSWORD", ""),
         PG_DATABASE=os.getenv("PG_DATABASE", "spendsense"),
+        
+        # OCR
+        OCR_MAX_WORKERS=int(os.getenv("OCR_MAX_WORKERS", "0")),
     )
 
 
+class _LazySettings:
+    """
+    Stand-in for the Settings instance that loads it on first use.
+    
+    Importing the config (directly or via another module) stays cheap:
+    .env parsing and env var reads only happen when a setting is read.
+    """
+
+    def __getattr__(self, name: str):
+        return getattr(_load_settings(), name)
+
+    def __repr__(self) -> str:
+        return repr(_load_settings())
+
+
 # Global settings instance
-settings = _load_settings()
+settings: Settings = _LazySettings()  # type: ignore[assignment]
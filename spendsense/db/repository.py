@@ -1,10 +1,23 @@
 """Repository pattern for database operations."""
 from datetime import date
 
-from sqlalchemy import func, extract
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from spendsense.models import Transaction, Statement
+from spendsense.utils.dates import month_bounds
+
+
+# Rows per INSERT in bulk_create: 7 bound parameters per row keeps each
+# statement well under PostgreSQL's 65535-parameter limit
+BULK_INSERT_PAGE_SIZE = 5000
+
+
+def _in_month(year: int, month: int) -> tuple:
+    """Range filter on posted_date for a month (index-friendly, unlike extract())."""
+    start, end = month_bounds(f"{year:04d}-{month:02d}")
+    return Transaction.posted_date >= start, Transaction.posted_date < end
 
 
 class StatementRepository:
@@ -28,7 +41,7 @@ class StatementRepository:
     
     def update_count(self, statement_id: int, count: int) -> None:
         """Update transaction count for a statement."""
-        stmt = self.session.query(Statement).get(statement_id)
+        stmt = self.session.get(Statement, statement_id)
         if stmt:
             stmt.transaction_count = count
     
@@ -57,11 +70,12 @@ class TransactionRepository:
         Create a transaction if it doesn't exist.
         Returns None if duplicate (by dedupe_hash).
         """
-        existing = self.session.query(Transaction).filter(
-            Transaction.dedupe_hash == dedupe_hash
-        ).first()
+        # Only check existence; no need to load the whole row
+        existing = self.session.scalar(
+            select(Transaction.id).where(Transaction.dedupe_hash == dedupe_hash).limit(1)
+        )
         
-        if existing:
+        if existing is not None:
             return None
         
         txn = Transaction(
@@ -76,13 +90,50 @@ class TransactionRepository:
         self.session.add(txn)
         return txn
     
+    def bulk_create(self, rows: list[dict]) -> int:
+        """
+        Create many transactions with multi-row INSERTs, skipping duplicates.
+        
+        Each row takes the same fields as create(). Rows are inserted
+        BULK_INSERT_PAGE_SIZE at a time. Duplicates (by dedupe_hash),
+        including repeats within rows, are skipped by ON CONFLICT instead
+        of a lookup per row.
+        
+        Returns the number of transactions inserted.
+        """
+        if not rows:
+            return 0
+        
+        values = [
+            {
+                "posted_date": row["posted_date"],
+                "amount": abs(row["amount"]),
+                "description": row["description"],
+                "merchant": row.get("merchant"),
+                "category": row.get("category"),
+                "statement_id": row.get("statement_id"),
+                "dedupe_hash": row["dedupe_hash"],
+            }
+            for row in rows
+        ]
+        inserted = 0
+        for start in range(0, len(values), BULK_INSERT_PAGE_SIZE):
+            stmt = (
+                pg_insert(Transaction)
+                .values(values[start:start + BULK_INSERT_PAGE_SIZE])
+                .on_conflict_do_nothing(index_elements=["dedupe_hash"])
+                .returning(Transaction.id)
+            )
+            inserted += len(self.session.execute(stmt).all())
+        return inserted
+    
     def get_by_id(self, txn_id: int) -> Transaction | None:
         """Get transaction by ID."""
-        return self.session.query(Transaction).get(txn_id)
+        return self.session.get(Transaction, txn_id)
     
     def update_category(self, txn_id: int, category: str) -> None:
         """Update category of a transaction."""
-        txn = self.session.query(Transaction).get(txn_id)
+        txn = self.session.get(Transaction, txn_id)
         if txn:
             txn.category = category
     
@@ -92,19 +143,20 @@ class TransactionRepository:
     
     def get_available_months(self) -> list[str]:
         """Get list of months with transactions (YYYY-MM format)."""
-        # PostgreSQL use to_char, SQLite uses strftime
-        # Since we've moved to Postgres:
+        # DISTINCT on the truncated date and format only the few results,
+        # rather than formatting every row with to_char
         results = self.session.query(
-            func.to_char(Transaction.posted_date, 'YYYY-MM').label('month')
+            func.date_trunc('month', Transaction.posted_date).label('month')
         ).distinct().order_by('month').all()
-        return [r.month for r in results]
+        return [r.month.strftime("%Y-%m") for r in results]
     
     def get_for_month(self, year: int, month: int) -> list[Transaction]:
         """Get all transactions for a given month."""
-        return self.session.query(Transaction).filter(
-            extract('year', Transaction.posted_date) == year,
-            extract('month', Transaction.posted_date) == month
-        ).order_by(Transaction.posted_date).all()
+        return self.session.scalars(
+            select(Transaction)
+            .where(*_in_month(year, month))
+            .order_by(Transaction.posted_date)
+        ).all()
     
     def get_category_totals(self, year: int, month: int) -> list[tuple[str, float]]:
         """Get category totals for a given month."""
@@ -112,8 +164,7 @@ class TransactionRepository:
             Transaction.category,
             func.sum(Transaction.amount).label('total')
         ).filter(
-            extract('year', Transaction.posted_date) == year,
-            extract('month', Transaction.posted_date) == month
+            *_in_month(year, month)
         ).group_by(Transaction.category).order_by(
             func.sum(Transaction.amount).desc()
         ).all()
@@ -125,8 +176,7 @@ class TransactionRepository:
             Transaction.merchant,
             func.sum(Transaction.amount).label('total')
         ).filter(
-            extract('year', Transaction.posted_date) == year,
-            extract('month', Transaction.posted_date) == month
+            *_in_month(year, month)
         ).group_by(Transaction.merchant).order_by(
             func.sum(Transaction.amount).desc()
         ).all()
@@ -135,21 +185,30 @@ class TransactionRepository:
     def get_top_transactions(self, year: int, month: int, limit: int = 5) -> list[Transaction]:
         """Get top N transactions by amount for a given month."""
         return self.session.query(Transaction).filter(
-            extract('year', Transaction.posted_date) == year,
-            extract('month', Transaction.posted_date) == month
+            *_in_month(year, month)
         ).order_by(Transaction.amount.desc()).limit(limit).all()
     
     def get_monthly_total(self, year: int, month: int) -> float:
         """Get total spending for a given month."""
         result = self.session.query(func.sum(Transaction.amount)).filter(
-            extract('year', Transaction.posted_date) == year,
-            extract('month', Transaction.posted_date) == month
+            *_in_month(year, month)
         ).scalar()
         return result or 0.0
     
+    def get_monthly_summary(self, year: int, month: int) -> tuple[float, int]:
+        """Get total spending and transaction count for a month in one query."""
+        total, count = self.session.query(
+            func.coalesce(func.sum(Transaction.amount), 0.0),
+            func.count(Transaction.id),
+        ).filter(
+            *_in_month(year, month)
+        ).one()
+        return total, count
+    
     def get_count(self, year: int, month: int) -> int:
         """Get transaction count for a given month."""
-        return self.session.query(Transaction).filter(
-            extract('year', Transaction.posted_date) == year,
-            extract('month', Transaction.posted_date) == month
-        ).count()
+        # COUNT directly instead of Query.count()'s SELECT count(*) over a
+        # subquery of every column
+        return self.session.scalar(
+            select(func.count(Transaction.id)).where(*_in_month(year, month))
+        )
@@ -1,20 +1,42 @@
 """Database session management."""
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.orm import sessionmaker, Session
 
 from spendsense.config import settings
 from spendsense.models import Base
 
 
+_engine_options = {}
+if make_url(settings.database_url).get_driver_name() == "psycopg2":
+    # psycopg2 only: multi-row VALUES for executemany INSERTs, execute_batch
+    # for UPDATE/DELETE executemany
+    _engine_options["executemany_mode"] = "values_plus_batch"
+
 # Create engine
-engine = create_engine(settings.database_url, echo=False)
+engine = create_engine(
+    settings.database_url,
+    echo=False,
+    # Check pooled connections before use and recycle them before server or
+    # proxy idle timeouts drop them, instead of failing the first query
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    **_engine_options,
+)
 
 # Session factory
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
 
+def init_db() -> None:
+    """
+    Create any missing tables and indexes.
+    
+    For an existing database, prefer `alembic upgrade head`; this only
+    creates what is absent and never alters existing tables.
+    """
+    Base.metadata.create_all(bind=engine)
 
 
 @contextmanager
@@ -1,4 +1,8 @@
 """File I/O utilities."""
-from spendsense.io.csv import load_transactions_csv, write_transactions_csv
+from spendsense.io.csv import (
+    iter_transactions_csv,
+    load_transactions_csv,
+    write_transactions_csv,
+)
 
-__all__ = ["load_transactions_csv", "write_transactions_csv"]
+__all__ = ["iter_transactions_csv", "load_transactions_csv", "write_transactions_csv"]
@@ -1,10 +1,65 @@
 """CSV file operations for transactions."""
 import csv
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from spendsense.utils.dates import normalize_date
 
 
+def _label(row: list, i: int | None) -> str | None:
+    """Read an optional category/merchant column, interning its value."""
+    if i is None:
+        return None
+    value = row[i]
+    # A few distinct labels repeat across every row; share one string each
+    return sys.intern(value) if value else value
+
+
+def iter_transactions_csv(filename: str | Path) -> Iterator[dict]:
+    """
+    Stream transactions from a CSV file one row at a time.
+
+    Required columns: date, description, amount
+    Optional columns: category, merchant
+    
+    Args:
+        filename: Path to CSV file
+    
+    Yields:
+        Transaction dictionaries
+    """
+    with open(filename, newline="", encoding="utf-8") as f:
+        # Plain csv.reader with column positions resolved from the header
+        # once, rather than a DictReader dict per row
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        columns = {name: i for i, name in enumerate(header)}
+        i_date = columns["date"]
+        i_description = columns["description"]
+        i_amount = columns["amount"]
+        i_category = columns.get("category")
+        i_merchant = columns.get("merchant")
+        width = len(header)
+
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                # Short rows read missing fields as None, like DictReader
+                row += [None] * (width - len(row))
+            yield {
+                "date": normalize_date(row[i_date]),
+                "description": row[i_description],
+                "amount": float(row[i_amount]),
+                "category": _label(row, i_category),
+                "merchant": _label(row, i_merchant),
+            }
+
+
 def load_transactions_csv(filename: str | Path) -> list[dict]:
     """
     Load transactions from a CSV file.
@@ -18,18 +73,12 @@ def load_transactions_csv(filename: str | Path) -> list[dict]:
     Returns:
         List of transaction dictionaries
     """
-    transactions = []
-    with open(filename, newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            transactions.append({
-                "date": normalize_date(row["date"]),
-                "description": row["description"],
-                "amount": float(row["amount"]),
-                "category": row.get("category"),
-                "merchant": row.get("merchant"),
-            })
-    return transactions
+    return list(iter_transactions_csv(filename))
+
+
+def _format_field(value):
+    # Amounts are floats in memory; keep the statement's 2-decimal form on disk
+    return f"{value:.2f}" if isinstance(value, float) else value
 
 
 def write_transactions_csv(filename: str | Path, transactions: list[dict]) -> None:
@@ -41,7 +90,13 @@ def write_transactions_csv(filename: str | Path, transactions: list[dict]) -> No
         transactions: List of transaction dictionaries
     """
     fieldnames = ["date", "description", "amount", "category", "merchant"]
-    with open(filename, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(transactions)
+    # Large write buffer so rows are flushed in a few big writes
+    with open(filename, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        # Plain csv.writer over tuples skips DictWriter's per-row dict
+        # handling; missing fields are written empty as before
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            tuple(_format_field(txn.get(field, "")) for field in fieldnames)
+            for txn in transactions
+        )
@@ -2,7 +2,7 @@
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Float, Date, Text, Integer, ForeignKey, Index
+from sqlalchemy import String, Float, Date, Text, Integer, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from spendsense.models.base import Base
@@ -44,10 +44,19 @@ class Transaction(Base):
 
     # Indexes for common queries
     __table_args__ = (
-        Index("idx_transactions_posted_date", "posted_date"),
+        Index(
+            "idx_transactions_posted_date",
+            "posted_date",
+            postgresql_include=["category", "amount"],
+        ),
         Index("idx_transactions_category", "category"),
         Index("idx_transactions_merchant", "merchant"),
         Index("idx_transactions_statement", "statement_id"),
+        Index(
+            "idx_transactions_posted_date_abs_amount",
+            "posted_date",
+            text("abs(amount) DESC"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1,6 +1,15 @@
 """External services."""
-from spendsense.services.llm import LLMService
-from spendsense.services.prompts import build_category_prompt
+from spendsense.services.llm import LLMService, get_llm_service
+from spendsense.services.prompts import (
+    build_category_prompt,
+    build_batch_category_prompt,
+    build_category_system_prompt,
+    build_category_response_format,
+    build_batch_category_response_format,
+    normalize_description,
+)
+from spendsense.services.category_cache import CategoryCache
+from spendsense.services.categorizer import categorize_transactions
 from spendsense.services.ocr import (
     is_ocr_available,
     extract_text_from_pdf,
@@ -8,7 +17,15 @@ from spendsense.services.ocr import (
 
 __all__ = [
     "LLMService",
+    "get_llm_service",
     "build_category_prompt",
+    "build_batch_category_prompt",
+    "build_category_system_prompt",
+    "build_category_response_format",
+    "build_batch_category_response_format",
+    "normalize_description",
+    "CategoryCache",
+    "categorize_transactions",
     "is_ocr_available",
     "extract_text_from_pdf",
 ]
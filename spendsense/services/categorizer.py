@@ -0,0 +1,166 @@
+"""
+Transaction categorization service.
+
+Assigns a category and merchant to each transaction using the LLM,
+asking only about descriptions that are not already cached and sending
+several transactions per request.
+
+Usage:
+    from spendsense.services.categorizer import categorize_transactions
+    
+    results = categorize_transactions(transactions)
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from spendsense.config import settings
+from spendsense.core import CATEGORIES
+from spendsense.services.category_cache import CategoryCache, cache_key
+from spendsense.services.llm import LLMService, get_llm_service
+from spendsense.services.prompts import (
+    build_category_prompt,
+    build_batch_category_prompt,
+    build_category_system_prompt,
+    build_category_response_format,
+    build_batch_category_response_format,
+)
+
+
+# orjson's decode error subclasses json.JSONDecodeError, so either parser
+# works with the except clauses below
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Prompt pieces that do not depend on the transactions, built once at import
+# instead of per batch
+_SYSTEM_PROMPT = build_category_system_prompt(CATEGORIES)
+_RESPONSE_FORMAT = build_category_response_format(CATEGORIES)
+_BATCH_RESPONSE_FORMAT = build_batch_category_response_format(CATEGORIES)
+
+
+def parse_category_response(response: str) -> dict:
+    """
+    Parse a single-transaction LLM response into category and merchant.
+    
+    Args:
+        response: Raw model response text
+    
+    Returns:
+        Dictionary with keys: category, merchant
+    """
+    try:
+        # Try to parse as JSON
+        data = _json_loads(response)
+        category = data.get("category", "Others")
+        merchant = data.get("merchant", "Unknown")
+    except json.JSONDecodeError:
+        # Fallback: if LLM didn't return JSON, treat as category only
+        category = response.strip()
+        merchant = "Unknown"
+    return {"category": category, "merchant": merchant}
+
+
+def categorize_batch(llm: LLMService, batch: list[dict]) -> list[dict]:
+    """
+    Categorize a batch of transactions with a single LLM request.
+    
+    Falls back to one request per transaction if the batched response
+    cannot be parsed or does not cover every transaction.
+    
+    Args:
+        llm: LLM service client
+        batch: Transaction dictionaries with description and amount
+    
+    Returns:
+        List of {category, merchant} dictionaries in the same order as batch
+    """
+    items = [(t["description"], t["amount"]) for t in batch]
+    response = llm.ask(
+        build_batch_category_prompt(items),
+        system_prompt=_SYSTEM_PROMPT,
+        response_format=_BATCH_RESPONSE_FORMAT,
+    )
+    
+    try:
+        by_id = {int(item["id"]): item for item in _json_loads(response)["results"]}
+        return [
+            {
+                "category": by_id[i]["category"],
+                "merchant": by_id[i].get("merchant", "Unknown"),
+            }
+            for i in range(1, len(batch) + 1)
+        ]
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+        # Batched reply was malformed; categorize these one at a time.
+        # The client caps requests in flight, so this nested fan-out shares
+        # the OPENAI_MAX_CONCURRENCY limit with the other batch workers.
+        responses = llm.ask_many(
+            [build_category_prompt(description, amount) for description, amount in items],
+            system_prompt=_SYSTEM_PROMPT,
+            response_format=_RESPONSE_FORMAT,
+        )
+        return [parse_category_response(response) for response in responses]
+
+
+def categorize_transactions(
+    transactions: list[dict],
+    llm: LLMService | None = None,
+    cache: CategoryCache | None = None,
+) -> list[dict]:
+    """
+    Categorize transactions, calling the LLM only for uncached descriptions.
+    
+    Transactions with the same cache key share one result, uncached ones are grouped into
+    batches of OPENAI_BATCH_SIZE, and up to OPENAI_MAX_CONCURRENCY batches
+    are in flight at once. New results are written back to the cache.
+    
+    Args:
+        transactions: Transaction dictionaries with description and amount
+        llm: LLM service client (defaults to the shared LLMService)
+        cache: Category cache (defaults to the on-disk CategoryCache)
+    
+    Returns:
+        List of {category, merchant} dictionaries in the same order as transactions
+    
+    Raises:
+        RuntimeError: If an LLM request fails
+    """
+    if llm is None:
+        llm = get_llm_service()
+    if cache is None:
+        cache = CategoryCache()
+    
+    # Only transactions without a cached answer need an LLM call, and
+    # transactions with the same key share one call
+    pending: dict[str, dict] = {}
+    for transaction in transactions:
+        description, amount = transaction["description"], transaction["amount"]
+        key = cache_key(description, amount)
+        if key not in pending and cache.get(description, amount) is None:
+            pending[key] = transaction
+    
+    # Group uncached transactions so each LLM request categorizes several
+    batch_size = settings.OPENAI_BATCH_SIZE
+    pending_txns = list(pending.values())
+    batches = [
+        pending_txns[i:i + batch_size]
+        for i in range(0, len(pending_txns), batch_size)
+    ]
+    
+    try:
+        # LLM calls are network-bound, so keep several in flight at once.
+        # The pool size bounds concurrency to stay within API rate limits.
+        with ThreadPoolExecutor(max_workers=settings.OPENAI_MAX_CONCURRENCY) as executor:
+            results = executor.map(lambda batch: categorize_batch(llm, batch), batches)
+            
+            for batch, batch_results in zip(batches, results):
+                for transaction, result in zip(batch, batch_results):
+                    cache.set(transaction["description"], transaction["amount"], result)
+    finally:
+        # Keep whatever was categorized, even if a later request failed
+        cache.save()
+    
+    return [cache.get(t["description"], t["amount"]) for t in transactions]
@@ -0,0 +1,73 @@
+"""Persistent cache of LLM categorization results."""
+import json
+from pathlib import Path
+
+from spendsense.config import settings
+from spendsense.utils.merchant import normalize_description
+
+
+def cache_key(description: str, amount: float) -> str:
+    """
+    Normalize a transaction into a cache key.
+    
+    Uses the same normalize_description as the categorization prompt, so
+    descriptions that differ only in store numbers, phone numbers and
+    reference codes share one entry. The amount's sign is kept because a
+    refund or payment may categorize differently from a purchase.
+    
+    Args:
+        description: Raw transaction description
+        amount: Transaction amount
+    
+    Returns:
+        Sign-prefixed, normalized description
+    """
+    stem = normalize_description(description)
+    if not stem:
+        # Nothing but digits; keep them rather than collapse to an empty key
+        stem = " ".join(description.split())
+    sign = "-" if amount < 0 else "+"
+    return f"{sign} {stem}"
+
+
+class CategoryCache:
+    """
+    JSON-backed cache of category/merchant results keyed by description.
+    
+    Recurring merchants (subscriptions, the same grocery store) repeat across
+    statements, so each distinct description only needs one LLM call.
+    
+    Usage:
+        cache = CategoryCache()
+        result = cache.get("NETFLIX.COM 1-866-579-7172 CA", 15.49)
+        if result is None:
+            cache.set("NETFLIX.COM 1-866-579-7172 CA", 15.49, {"category": ..., "merchant": ...})
+        cache.save()
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else settings.DATA_DIR / "category_cache.json"
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        
+        if self.path.exists():
+            with open(self.path) as f:
+                self._entries = json.load(f)
+
+    def get(self, description: str, amount: float) -> dict | None:
+        """Get the cached result for a transaction, or None on a miss."""
+        return self._entries.get(cache_key(description, amount))
+
+    def set(self, description: str, amount: float, result: dict) -> None:
+        """Store the result for a transaction."""
+        self._entries[cache_key(description, amount)] = result
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(self._entries, f, indent=2, sort_keys=True)
+        self._dirty = False
@@ -1,15 +1,80 @@
 """OpenAI LLM service client."""
+import hashlib
 import json
-import urllib.error
-import urllib.request
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Raised for a malformed response body by whichever JSON library is used
+_JSONDecodeError = orjson.JSONDecodeError if orjson is not None else json.JSONDecodeError
 
 from spendsense.config import settings
 
 
+# Retries for a 429 before giving up; each waits as long as the server asks
+MAX_RATE_LIMIT_RETRIES = 3
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(value: str) -> float:
+    """Parse a rate-limit reset duration like "1s", "6m0s" or "20ms" into seconds."""
+    return sum(float(n) * _UNIT_SECONDS[unit] for n, unit in _DURATION_PART.findall(value))
+
+
+def _retry_after_seconds(headers) -> float:
+    """Seconds to wait after a 429, from Retry-After or the reset header."""
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    reset = headers.get("x-ratelimit-reset-requests")
+    return _parse_duration(reset) if reset else 1.0
+
+
+# Responses kept in memory; requests use temperature 0, so the same model,
+# prompts and response format give the same answer
+RESPONSE_CACHE_SIZE = 10_000
+
+_response_cache: OrderedDict[str, str] = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(
+    model: str,
+    system_prompt: str,
+    prompt: str,
+    response_format: dict | None,
+) -> str:
+    fmt = json.dumps(response_format, sort_keys=True) if response_format else ""
+    raw = "\0".join((model, system_prompt, prompt, fmt))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
 class LLMService:
     """
     Client for OpenAI API interactions.
     
+    Requests go through one HTTP session, so connections to the API are
+    kept alive and reused instead of re-doing the TCP/TLS handshake per call.
+    
+    Rate limiting follows the server: calls only wait when the rate-limit
+    headers say the request quota is used up, or when a 429 asks to retry.
+    
     Usage:
         llm = LLMService()
         response = llm.ask("What category is this: Kroger grocery store?")
@@ -20,14 +85,101 @@ class LLMService:
         self.model = settings.OPENAI_MODEL
         self.base_url = settings.OPENAI_BASE_URL
         self.timeout = settings.OPENAI_TIMEOUT
+        
+        self._session = requests.Session()
+        # Keep one pooled connection per concurrent categorization worker,
+        # and retry transient server errors with backoff. 429s are handled
+        # in _post so they can follow the rate-limit headers.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=settings.OPENAI_MAX_CONCURRENCY,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        })
+        
+        # Shared by worker threads: no request is sent before this time
+        self._rate_limit_lock = threading.Lock()
+        self._blocked_until = 0.0
+        
+        # Caps requests in flight across every thread using this client
+        # (including ask_many pools started inside other workers), so the
+        # connection pool and OPENAI_MAX_CONCURRENCY are never exceeded
+        self._request_slots = threading.BoundedSemaphore(settings.OPENAI_MAX_CONCURRENCY)
+
+    def __enter__(self) -> "LLMService":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
 
-    def ask(self, prompt: str, system_prompt: str | None = None) -> str:
+    def _wait_for_rate_limit(self) -> None:
+        with self._rate_limit_lock:
+            delay = self._blocked_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _block_for(self, seconds: float) -> None:
+        with self._rate_limit_lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def _post(self, payload: dict) -> requests.Response:
+        """POST the payload, waiting out rate limits the server reports."""
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self._wait_for_rate_limit()
+            with self._request_slots:
+                if orjson is not None:
+                    resp = self._session.post(
+                        self.base_url, data=orjson.dumps(payload), timeout=self.timeout
+                    )
+                else:
+                    resp = self._session.post(self.base_url, json=payload, timeout=self.timeout)
+            
+            if resp.status_code == 429:
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    break
+                self._block_for(_retry_after_seconds(resp.headers))
+                continue
+            
+            # Out of requests for this window: hold further calls until reset
+            if resp.headers.get("x-ratelimit-remaining-requests") == "0":
+                reset = resp.headers.get("x-ratelimit-reset-requests")
+                if reset:
+                    self._block_for(_parse_duration(reset))
+            break
+        return resp
+
+    def ask(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        response_format: dict | None = None,
+    ) -> str:
         """
         Send a prompt to the LLM and return the response.
         
+        Identical requests made earlier in the process are answered from an
+        in-memory LRU cache without calling the API.
+        
         Args:
             prompt: The user prompt
             system_prompt: Optional system prompt (defaults to concise assistant)
+            response_format: Optional OpenAI response_format, e.g. a JSON schema
+                that constrains the reply to structured output
         
         Returns:
             The model's response text
@@ -38,6 +190,13 @@ class LLMService:
         if system_prompt is None:
             system_prompt = "Follow instructions exactly. Keep outputs concise."
         
+        cache_key = _response_cache_key(self.model, system_prompt, prompt, response_format)
+        with _response_cache_lock:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                _response_cache.move_to_end(cache_key)
+                return cached
+        
         payload = {
             "model": self.model,
             "temperature": 0,
@@ -46,22 +205,70 @@ class LLMService:
                 {"role": "user", "content": prompt},
             ],
         }
-
-        req = urllib.request.Request(
-            self.base_url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
-            method="POST",
-        )
+        if response_format is not None:
+            payload["response_format"] = response_format
 
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-                return data["choices"][0]["message"]["content"].strip()
-        except urllib.error.HTTPError as e:
-            raise RuntimeError(f"OpenAI API error: {e.code}") from e
-        except urllib.error.URLError as e:
+            resp = self._post(payload)
+            resp.raise_for_status()
+            data = (orjson.loads if orjson is not None else json.loads)(resp.content)
+            content = data["choices"][0]["message"]["content"].strip()
+        except _JSONDecodeError as e:
+            raise RuntimeError(f"Invalid JSON from OpenAI API: {e}") from e
+        except requests.HTTPError as e:
+            raise RuntimeError(f"OpenAI API error: {e.response.status_code}") from e
+        except requests.RequestException as e:
             raise RuntimeError(f"Request failed: {e}") from e
+        
+        with _response_cache_lock:
+            _response_cache[cache_key] = content
+            if len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+        return content
+
+    def ask_many(
+        self,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        response_format: dict | None = None,
+    ) -> list[str]:
+        """
+        Send several independent prompts concurrently.
+        
+        All requests are submitted before any result is awaited. However
+        many threads are waiting, at most OPENAI_MAX_CONCURRENCY requests
+        are in flight at once on this client, so ask_many is safe to call
+        from inside other worker threads.
+        
+        Args:
+            prompts: User prompts to send
+            system_prompt: System prompt shared by every request
+            response_format: Optional response_format shared by every request
+        
+        Returns:
+            Response texts in the same order as prompts
+        
+        Raises:
+            RuntimeError: If any API call fails
+        """
+        if not prompts:
+            return []
+        
+        max_workers = min(settings.OPENAI_MAX_CONCURRENCY, len(prompts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.ask, prompt, system_prompt, response_format)
+                for prompt in prompts
+            ]
+            return [future.result() for future in futures]
+
+
+@lru_cache(maxsize=1)
+def get_llm_service() -> LLMService:
+    """
+    Get the shared LLMService instance.
+    
+    All callers reuse one client, and with it one pool of keep-alive
+    connections to the API.
+    """
+    return LLMService()
@@ -2,20 +2,22 @@
 PDF Processing Service
 
 This module handles extraction of transaction data from PDF files.
-All PDFs are converted to images and processed with Tesseract OCR.
+Digital PDFs are read from their text layer; scanned PDFs are converted
+to images and processed with Tesseract OCR.
 
 Flow:
-1. Convert PDF pages to images
-2. Extract text using Tesseract
+1. Read the text layer, or convert PDF pages to images
+2. Extract text using Tesseract (scanned PDFs only)
 3. Combine multi-line transactions
 4. Parse transactions using regex patterns
 5. Return structured transaction data
 """
 
 import re
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-from spendsense.services.ocr import extract_text_from_pdf
+from spendsense.services.ocr import iter_pdf_page_texts
 
 
 # Pattern: lines that START a transaction (dates like 11/01/25)
@@ -29,152 +31,212 @@ DATE_LINE = re.compile(
     re.VERBOSE,
 )
 
-# Pattern to extract date, description, amount from combined line
-TXN_PATTERN = re.compile(
-    r"^\s*(\d{2}/\d{2}/\d{2})\s+(.+?)\s+(-?\$?\d+\.\d{2})\s*$"
+# Header that opens the charges section, and headings that close it
+SECTION_START = "New Charges Details"
+SECTION_END = re.compile(r"\s*(?:Fees|Interest|About )")
+
+# Pattern to extract date, description, amount from combined line.
+# The description starts and (being lazy) ends on a non-space character;
+# amounts may carry thousands separators ("$1,234.50"). Separators are any
+# whitespace except a newline ([^\S\n], which includes "\xa0"), so the
+# same source also matches records joined by newlines in one scan.
+_TXN_SOURCE = (
+    r"^[^\S\n]*(\d{2}/\d{2}/\d{2})[^\S\n]+(\S.*?)[^\S\n]+"
+    r"(-?\$?(?:\d{1,3}(?:,\d{3})+|\d+)\.\d{2})[^\S\n]*$"
 )
+TXN_PATTERN = re.compile(_TXN_SOURCE)
+_TXN_MULTI = re.compile(_TXN_SOURCE, re.MULTILINE)
+
+# Characters dropped from amounts before float()
+_AMOUNT_TABLE = str.maketrans("", "", "$,")
+
+
+def iter_details_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield only the lines inside the "New Charges Details" section.
+    
+    Args:
+        lines: Text lines of the statement, in order
+        
+    Yields:
+        Lines between the section header and the next section heading
+    """
+    in_details = False
+    for line in lines:
+        if SECTION_START in line:
+            in_details = True
+        elif in_details:
+            if SECTION_END.match(line):
+                in_details = False
+            else:
+                yield line
+
+
+def iter_pdf_lines(path: str) -> Iterator[str]:
+    """
+    Yield the "New Charges Details" lines of a PDF as pages are read.
+    
+    Peak memory is one page of text rather than the whole statement.
+    
+    Args:
+        path: Path to the PDF file
+        
+    Yields:
+        Text lines from the charge details section
+    """
+    # One filter over all pages: the section may continue onto the next page
+    all_lines = (
+        line
+        for page_text in iter_pdf_page_texts(path)
+        for line in page_text.splitlines()
+    )
+    yield from iter_details_lines(all_lines)
 
 
 def read_pdf_lines(path: str) -> list[str]:
     """
     Extract text lines from a PDF file.
     
-    Uses Tesseract OCR (via pdf2image) to treat all PDFs as images
-    and extract text. This ensures consistent handling of both
-    digital and scanned PDFs.
+    Uses the PDF's text layer when present, and Tesseract OCR (via
+    pdf2image) for scanned PDFs.
     
     Args:
         path: Path to the PDF file
-        use_ocr: Ignored (kept for backward compatibility, OCR is always used)
         
     Returns:
         List of text lines extracted from the PDF
     """
-    # Simply extract all text using Tesseract
-    full_text = extract_text_from_pdf(path)
-    all_lines = full_text.splitlines()
+    return list(iter_pdf_lines(path))
 
-    # Filter to keep only the "New Charges Details" section
-    filtered: list[str] = []
-    in_details = False
-    for line in all_lines:
-        if "New Charges Details" in line:
-            in_details = True
-            continue
-        if in_details and line.strip().startswith(("Fees", "Interest", "About ")):
-            in_details = False
-        if in_details:
-            filtered.append(line)
 
-    return filtered
+def _may_start_transaction(line: str) -> bool:
+    """
+    Cheap prefilter for DATE_LINE on a stripped, non-empty line.
+    
+    A date needs one or two digits followed by "/" or "-", so most
+    continuation lines are rejected without reaching the regex engine.
+    """
+    if not line[0].isdigit():
+        return False
+    sep = line[2:3] if line[1:2].isdigit() else line[1:2]
+    return sep in ("/", "-")
 
 
-def combine_wrapped_transactions(lines: list[str]) -> list[str]:
+def iter_records(lines: Iterable[str]) -> Iterator[str]:
     """
-    Combine 2-line transactions into one string.
+    Yield 2-line transactions combined into one string, as lines arrive.
 
     Example input lines:
         018: 11/01/25 ABC*NATIONAL INSTITUTE F  INDIANAPOLIS  IN
         019: 317-274-3432 $39.50
         
-    Returns:
-        ['11/01/25 ABC*NATIONAL INSTITUTE F INDIANAPOLIS IN 317-274-3432 $39.50', ...]
+    Yields:
+        '11/01/25 ABC*NATIONAL INSTITUTE F INDIANAPOLIS IN 317-274-3432 $39.50', ...
     """
-    records: list[str] = []
-    current: str | None = None
+    fragments: list[str] = []
 
     for raw in lines:
         line = raw.strip()
         if not line:
             continue
 
-        if DATE_LINE.match(line):
+        if _may_start_transaction(line) and DATE_LINE.match(line):
             # new transaction starts
-            if current:
-                records.append(current)
-            current = line
-        else:
+            if fragments:
+                yield " ".join(fragments)
+            fragments = [line]
+        elif fragments:
             # continuation of previous transaction
-            if current:
-                current = current + " " + line
-
-    if current:
-        records.append(current)
+            fragments.append(line)
 
-    return records
+    if fragments:
+        yield " ".join(fragments)
 
 
-def parse_transactions(records: list[str]) -> list[dict]:
+def combine_wrapped_transactions(lines: Iterable[str]) -> list[str]:
     """
-    Extract date, description, amount from combined transaction records.
+    Combine 2-line transactions into one string.
     
     Args:
-        records: List of combined transaction strings
+        lines: Text lines from the charge details section
         
     Returns:
-        List of transaction dictionaries with keys: date, description, amount
+        List of combined transaction strings (see iter_records)
     """
-    txns: list[dict] = []
+    return list(iter_records(lines))
 
-    for rec in records:
-        m = TXN_PATTERN.match(rec)
-        if not m:
-            # Skip lines that don't match the pattern
-            continue
 
-        date, middle, amount = m.groups()
+def _to_transaction(date: str, middle: str, amount: str) -> dict:
+    """Build a transaction dict from the three TXN_PATTERN groups."""
+    return {
+        "date": date,
+        "description": middle,
+        # Normalize amount: drop "$" and "," and parse once here, so later
+        # stages use the float directly
+        "amount": float(amount.translate(_AMOUNT_TABLE)),
+    }
 
-        # Normalize amount: drop $ sign
-        amount = amount.replace("$", "")
 
-        # Clean description
-        description = middle.strip()
+def iter_parsed(records: Iterable[str]) -> Iterator[dict]:
+    """
+    Yield date, description, amount from combined transaction records.
+    
+    Args:
+        records: Combined transaction strings
+        
+    Yields:
+        Transaction dictionaries with keys: date, description, amount
+    """
+    for rec in records:
+        m = TXN_PATTERN.match(rec)
+        # Skip lines that don't match the pattern
+        if m:
+            yield _to_transaction(*m.groups())
 
-        txns.append(
-            {
-                "date": date,
-                "description": description,
-                "amount": amount,
-            }
-        )
 
-    return txns
+def parse_transactions(records: Iterable[str]) -> list[dict]:
+    """
+    Extract date, description, amount from combined transaction records.
+    
+    All records are matched in a single regex scan over the joined text.
+    
+    Args:
+        records: Combined transaction strings
+        
+    Returns:
+        List of transaction dictionaries with keys: date, description, amount
+    """
+    blob = "\n".join(records)
+    return [_to_transaction(*groups) for groups in _TXN_MULTI.findall(blob)]
 
 
-def process_pdf(
-    pdf_path: str,
-    use_ocr: bool = True,
-    debug: bool = False
-) -> list[dict]:
+def process_pdf(pdf_path: str, *, debug: bool = False) -> list[dict]:
     """
     Complete PDF processing pipeline.
     
     This is the main function that orchestrates the entire process:
-    1. Extract text from PDF (with OCR if needed)
+    1. Extract text from PDF (text layer, or OCR for scanned PDFs)
     2. Combine multi-line transactions
     3. Parse transactions into structured data
     
     Args:
         pdf_path: Path to the PDF file
-        use_ocr: Whether to use OCR for scanned PDFs
         debug: If True, print debug information
         
     Returns:
         List of transaction dictionaries
     """
-    # Step 1: Extract lines from PDF
-    lines = read_pdf_lines(pdf_path, use_ocr=use_ocr)
-    
-    # Step 2: Combine wrapped transactions
-    records = combine_wrapped_transactions(lines)
+    # Each line streams through filtering, combining and parsing; only the
+    # final transaction list is materialized
+    records = iter_records(iter_pdf_lines(pdf_path))
     
     if debug:
+        records = list(records)
         print("Combined records:")
         for r in records:
             print(">>>", r)
     
-    # Step 3: Parse transactions
-    transactions = parse_transactions(records)
+    transactions = list(iter_parsed(records))
     
     if debug:
         print(f"Parsed {len(transactions)} transactions")
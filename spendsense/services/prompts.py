@@ -1,18 +1,21 @@
 """LLM prompt templates."""
 from spendsense.core import CATEGORIES
+from spendsense.utils.merchant import normalize_description
 
 
-def build_category_prompt(description: str, amount: float, categories: list[str] | None = None) -> str:
+def build_category_system_prompt(categories: list[str] | None = None) -> str:
     """
-    Build a prompt for transaction categorization AND merchant extraction.
+    Build the system prompt holding the static categorization rules.
+    
+    The rules and examples are identical for every transaction, so sending
+    them as the system message gives each request the same prefix, which
+    the provider can cache instead of re-processing it on every call.
     
     Args:
-        description: Transaction description
-        amount: Transaction amount
         categories: List of allowed categories (defaults to CATEGORIES)
     
     Returns:
-        Formatted prompt string asking for category and merchant
+        System prompt with category rules, merchant rules and examples
     """
     if categories is None:
         categories = CATEGORIES
@@ -54,11 +57,126 @@ Input: "AplPay SPEEDWAY 1-800-643-1949 OH 3176304925"
 Output: {{"category": "Transport", "merchant": "Speedway"}}
 
 Input: "NETFLIX.COM 1-866-579-7172 CA"
-Output: {{"category": "Digital Services", "merchant": "Netflix"}}
+Output: {{"category": "Digital Services", "merchant": "Netflix"}}"""
 
-Now analyze this transaction. Return ONLY valid JSON with category and merchant:
 
-Description: {description}
+def build_category_prompt(description: str, amount: float) -> str:
+    """
+    Build a prompt for transaction categorization AND merchant extraction.
+    
+    Send with build_category_system_prompt() as the system prompt.
+    
+    Args:
+        description: Transaction description
+        amount: Transaction amount
+    
+    Returns:
+        Formatted prompt string asking for category and merchant
+    """
+    return f"""Now analyze this transaction. Return ONLY valid JSON with category and merchant:
+
+Description: {normalize_description(description)}
 Amount: {amount}
 
 JSON:"""
+
+
+def build_batch_category_prompt(items: list[tuple[str, float]]) -> str:
+    """
+    Build a prompt that categorizes several transactions in one request.
+    
+    Transactions are numbered from 1 and the model is asked to echo each
+    number back as "id" so results can be matched to their inputs.
+    Send with build_category_system_prompt() as the system prompt.
+    
+    Args:
+        items: List of (description, amount) pairs
+    
+    Returns:
+        Formatted prompt string asking for a JSON list of results
+    """
+    listing = "\n".join(
+        f"{i}. Description: {normalize_description(description)} | Amount: {amount}"
+        for i, (description, amount) in enumerate(items, start=1)
+    )
+    
+    # Fixed instructions first and the per-batch part last, so every batch
+    # shares the longest possible prefix for provider-side prompt caching
+    return f"""Now analyze the transactions below. Return ONLY valid JSON with one result per transaction, each with its id, category and merchant:
+{{"results": [{{"id": 1, "category": "...", "merchant": "..."}}, ...]}}
+
+Transactions ({len(items)}):
+{listing}
+
+JSON:"""
+
+
+def _category_result_schema(categories: list[str]) -> dict:
+    """JSON schema for one category/merchant result."""
+    return {
+        "type": "object",
+        "properties": {
+            "category": {"type": "string", "enum": list(categories)},
+            "merchant": {"type": "string"},
+        },
+        "required": ["category", "merchant"],
+        "additionalProperties": False,
+    }
+
+
+def build_category_response_format(categories: list[str] | None = None) -> dict:
+    """
+    Build a structured-output response_format for build_category_prompt.
+    
+    Constrains the model to a JSON object whose category is one of the
+    allowed values, so replies need no free-text fallback handling.
+    
+    Args:
+        categories: List of allowed categories (defaults to CATEGORIES)
+    
+    Returns:
+        response_format payload for LLMService.ask
+    """
+    if categories is None:
+        categories = CATEGORIES
+    
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "transaction_category",
+            "strict": True,
+            "schema": _category_result_schema(categories),
+        },
+    }
+
+
+def build_batch_category_response_format(categories: list[str] | None = None) -> dict:
+    """
+    Build a structured-output response_format for build_batch_category_prompt.
+    
+    Args:
+        categories: List of allowed categories (defaults to CATEGORIES)
+    
+    Returns:
+        response_format payload for LLMService.ask
+    """
+    if categories is None:
+        categories = CATEGORIES
+    
+    item = _category_result_schema(categories)
+    item["properties"] = {"id": {"type": "integer"}, **item["properties"]}
+    item["required"] = ["id", *item["required"]]
+    
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "transaction_categories",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {"results": {"type": "array", "items": item}},
+                "required": ["results"],
+                "additionalProperties": False,
+            },
+        },
+    }
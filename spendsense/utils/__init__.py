@@ -1,9 +1,14 @@
 """Utility functions."""
-from spendsense.utils.hashing import compute_dedupe_hash
-from spendsense.utils.dates import normalize_date, parse_date
+from spendsense.utils.hashing import compute_dedupe_hash, compute_file_hash
+from spendsense.utils.dates import normalize_date, parse_date, month_bounds
+from spendsense.utils.merchant import clean_merchant_name, normalize_description
 
 __all__ = [
     "compute_dedupe_hash",
+    "compute_file_hash",
     "normalize_date",
     "parse_date",
+    "month_bounds",
+    "clean_merchant_name",
+    "normalize_description",
 ]
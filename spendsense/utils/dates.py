@@ -1,7 +1,34 @@
 """Date parsing and normalization utilities."""
 from __future__ import annotations
 
-from datetime import datetime
+import re
+from datetime import date, datetime
+
+
+_FORMATS = ("%Y-%m-%d", "%m/%d/%y", "%m/%d/%Y", "%m-%d-%y", "%m-%d-%Y")
+
+# Common shapes, matched directly: ISO, or MM/DD/YY[YY] with / or - separators
+_DATE_RX = re.compile(
+    r"^(?:(\d{4})-(\d{2})-(\d{2})|(\d{1,2})([/-])(\d{1,2})\5(\d{4}|\d{2}))$"
+)
+
+
+def _fast_parse(s: str) -> date | None:
+    """Parse the common formats without strptime; None if s doesn't fit."""
+    m = _DATE_RX.match(s)
+    if not m:
+        return None
+    if m.group(1):
+        year, month, day = m.group(1, 2, 3)
+    else:
+        month, day, year = m.group(4, 6, 7)
+        if len(year) == 2:
+            # Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s
+            year = int(year) + (1900 if int(year) >= 69 else 2000)
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
 
 
 def normalize_date(date_str: str) -> str:
@@ -25,8 +52,11 @@ def normalize_date(date_str: str) -> str:
     if not s:
         return s
 
-    formats = ("%Y-%m-%d", "%m/%d/%y", "%m/%d/%Y", "%m-%d-%y", "%m-%d-%Y")
-    for fmt in formats:
+    parsed = _fast_parse(s)
+    if parsed is not None:
+        return f"{parsed.year:04d}-{parsed.month:02d}-{parsed.day:02d}"
+
+    for fmt in _FORMATS:
         try:
             return datetime.strptime(s, fmt).strftime("%Y-%m-%d")
         except ValueError:
@@ -50,11 +80,33 @@ def parse_date(date_str: str) -> datetime | None:
     if not s:
         return None
 
-    formats = ("%Y-%m-%d", "%m/%d/%y", "%m/%d/%Y", "%m-%d-%y", "%m-%d-%Y")
-    for fmt in formats:
+    parsed = _fast_parse(s)
+    if parsed is not None:
+        return datetime(parsed.year, parsed.month, parsed.day)
+
+    for fmt in _FORMATS:
         try:
             return datetime.strptime(s, fmt)
         except ValueError:
             pass
 
     return None
+
+
+def month_bounds(month: str) -> tuple[date, date]:
+    """
+    Get the half-open date range [start, end) covering a month.
+    
+    Filtering with `posted_date >= start AND posted_date < end` lets the
+    database use the posted_date index, unlike formatting every row's date.
+    
+    Args:
+        month: Month string in YYYY-MM format
+    
+    Returns:
+        Tuple of (first day of the month, first day of the next month)
+    """
+    year, month_num = (int(part) for part in month.split("-"))
+    start = date(year, month_num, 1)
+    end = date(year + month_num // 12, month_num % 12 + 1, 1)
+    return start, end
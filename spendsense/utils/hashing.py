@@ -1,6 +1,7 @@
 """Hashing utilities for deduplication."""
 import hashlib
 from datetime import date
+from pathlib import Path
 
 
 def compute_dedupe_hash(posted_date: date | str, amount: float, description: str) -> str:
@@ -22,3 +23,19 @@ def compute_dedupe_hash(posted_date: date | str, amount: float, description: str
     raw = f"{date_str}|{amount_str}|{desc_str}"
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
+
+def compute_file_hash(file_path: str | Path) -> str:
+    """
+    Compute SHA-256 hash of a file's contents (e.g. a statement PDF).
+    
+    Uses hashlib.file_digest, which reads and hashes in C without holding
+    the GIL, instead of a Python read/update loop.
+    
+    Args:
+        file_path: Path to the file
+    
+    Returns:
+        64-character hex string
+    """
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
@@ -0,0 +1,139 @@
+"""Merchant name normalization."""
+import re
+from functools import lru_cache
+
+
+# Payment-processor prefixes that precede the merchant in descriptions
+_PREFIXES = (
+    "APLPAY ",
+    "APPLEPAY ",
+    "APPLE PAY ",
+    "SQ *",
+    "TST* ",
+    "PAYPAL *",
+    "POS PURCHASE ",
+    "POS ",
+    "PURCHASE ",
+    "CHECKCARD ",
+)
+
+# Trailing corporate/country tokens that are not part of the name
+_SUFFIXES = (" USA", " INC", " LLC", " CORP", " CO", " LTD")
+
+# One anchored match per side instead of a startswith/endswith per entry.
+# Prefix alternatives keep the tuple's order ("POS PURCHASE " before
+# "POS "); suffixes repeat so chains like " INC USA" are all removed. The
+# lookahead lets the suffix scan skip every position that isn't a space.
+_PREFIX_RE = re.compile("|".join(map(re.escape, _PREFIXES)))
+_SUFFIX_RE = re.compile(f"(?= )(?:{'|'.join(map(re.escape, _SUFFIXES))})+$")
+
+# US state and territory codes; a trailing one is the merchant's location,
+# while other two-letter words ("APPLE TV") are part of the name
+_STATE_CODES = frozenset({
+    "AK", "AL", "AR", "AS", "AZ", "CA", "CO", "CT", "DC", "DE",
+    "FL", "GA", "GU", "HI", "IA", "ID", "IL", "IN", "KS", "KY",
+    "LA", "MA", "MD", "ME", "MI", "MN", "MO", "MP", "MS", "MT",
+    "NC", "ND", "NE", "NH", "NJ", "NM", "NV", "NY", "OH", "OK",
+    "OR", "PA", "PR", "RI", "SC", "SD", "TN", "TX", "UT", "VA",
+    "VI", "VT", "WA", "WI", "WV", "WY",
+})
+
+# Phone numbers, store numbers and long digit runs (terminal/reference ids),
+# removed in a single pass. Shared by merchant cleanup, prompt text and
+# category cache keys so all three agree on what counts as noise.
+_JUNK = re.compile(
+    r"""
+    (?:\+?1[\s.\-]?)?\(?\d{3}\)?[\s.\-]?\d{3}[\s.\-]?\d{4}  # phone numbers
+    | \#\s*\d+                                              # store numbers
+    | \b\d{4,}\b                                            # ids, references
+    """,
+    re.VERBOSE,
+)
+
+# Every _JUNK alternative contains a digit, so this cheaper scan decides
+# whether _JUNK needs to run at all
+_HAS_DIGIT = re.compile(r"\d").search
+
+# Words whose spelling str.title() gets wrong ("Mcdonald'S", "Amazon.Com",
+# "Cvs"); looked up per word before falling back to title case
+_CANONICAL = {
+    "AMAZON.COM": "Amazon.com",
+    "AMZN": "Amazon",
+    "ARBY'S": "Arby's",
+    "AT&T": "AT&T",
+    "BP": "BP",
+    "CVS": "CVS",
+    "CVS/PHARMACY": "CVS Pharmacy",
+    "DENNY'S": "Denny's",
+    "DICK'S": "Dick's",
+    "IHOP": "IHOP",
+    "IKEA": "IKEA",
+    "JOE'S": "Joe's",
+    "KOHL'S": "Kohl's",
+    "LOWE'S": "Lowe's",
+    "MACY'S": "Macy's",
+    "MCDONALD'S": "McDonald's",
+    "MCDONALDS": "McDonald's",
+    "NETFLIX.COM": "Netflix.com",
+    "USPS": "USPS",
+    "WENDY'S": "Wendy's",
+}
+
+
+def normalize_description(description: str) -> str:
+    """
+    Reduce a description to the text that matters for categorization.
+
+    Drops phone numbers, store numbers and long digit runs, collapses
+    whitespace and uppercases, so the same merchant at different stores
+    yields the same (shorter) text.
+
+    Args:
+        description: Raw transaction description
+
+    Returns:
+        Normalized description
+    """
+    text = description.upper()
+    if _HAS_DIGIT(text):
+        text = _JUNK.sub(" ", text)
+    return " ".join(text.split())
+
+
+@lru_cache(maxsize=4096)
+def clean_merchant_name(description: str) -> str:
+    """
+    Derive a short merchant name from a raw statement description.
+
+    Strips payment-processor prefixes, phone and store numbers, reference
+    ids, a trailing state code and corporate suffixes, without an LLM call.
+    Known brand spellings are kept; other words are title-cased. Results
+    are memoized, since recurring merchants repeat across rows.
+
+    Args:
+        description: Raw transaction description
+
+    Returns:
+        Title-cased merchant name, or "" if nothing is left
+
+    Example:
+        >>> clean_merchant_name("AplPay KROGER #339 000000339 INDIANAPOLIS IN 3175798309")
+        'Kroger Indianapolis'
+    """
+    text = description.upper()
+
+    m = _PREFIX_RE.match(text)
+    if m:
+        text = text[m.end():]
+
+    if _HAS_DIGIT(text):
+        text = _JUNK.sub(" ", text)
+    text = " ".join(text.split())
+
+    # Drop the state code left at the end once the numbers are gone
+    head, _, last = text.rpartition(" ")
+    if head and last in _STATE_CODES:
+        text = head
+    text = _SUFFIX_RE.sub("", text, count=1)
+
+    return " ".join(_CANONICAL.get(word) or word.title() for word in text.split())
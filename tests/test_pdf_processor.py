@@ -0,0 +1,31 @@
+"""Tests for transaction record parsing."""
+from spendsense.services.pdf_processor import iter_parsed, parse_transactions
+
+
+RECORDS = [
+    "11/01/25 ABC*NATIONAL INSTITUTE F INDIANAPOLIS IN 317-274-3432 $39.50",
+    "11/02/25 FOO $1,234.00",
+    "not a transaction",
+    "11/05/25\xa0FOO BAR\xa0$5.00",
+    "11/06/25\tTAB -$2.00\xa0",
+    "11/07/25 BAD $12,34.00",
+]
+
+EXPECTED = [
+    ("11/01/25", "ABC*NATIONAL INSTITUTE F INDIANAPOLIS IN 317-274-3432", 39.5),
+    ("11/02/25", "FOO", 1234.0),
+    ("11/05/25", "FOO BAR", 5.0),
+    ("11/06/25", "TAB", -2.0),
+]
+
+
+def _as_tuples(transactions):
+    return [(t["date"], t["description"], t["amount"]) for t in transactions]
+
+
+def test_parse_transactions():
+    assert _as_tuples(parse_transactions(RECORDS)) == EXPECTED
+
+
+def test_iter_parsed():
+    assert _as_tuples(iter_parsed(RECORDS)) == EXPECTED
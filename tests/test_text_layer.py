@@ -0,0 +1,68 @@
+"""Tests for reading digital statements from their PDF text layer."""
+import pytest
+
+pytest.importorskip("pypdf")
+
+from spendsense.services.ocr import read_text_layer  # noqa: E402
+from spendsense.services.pdf_processor import process_pdf  # noqa: E402
+
+
+# One text row per statement line, amounts on the same row as their record
+STATEMENT_LINES = [
+    "Example Card Services - Monthly Statement - Account ending 1234",
+    "Statement closing date 11/30/25 - Payment due date 12/25/25",
+    "New Charges Details",
+    "11/01/25 KROGER #339 INDIANAPOLIS IN          $39.50",
+    "11/02/25 ABC*NATIONAL INSTITUTE F INDIANAPOLIS IN",
+    "317-274-3432                                  $1,234.00",
+    "Fees",
+    "11/03/25 LATE FEE                             $25.00",
+]
+
+
+def _write_pdf(path, lines):
+    """Write a one-page PDF whose text layer holds the given lines."""
+    ops = ["BT", "/F1 10 Tf"]
+    y = 740
+    for text in lines:
+        escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        ops.append(f"1 0 0 1 72 {y} Tm ({escaped}) Tj")
+        y -= 14
+    ops.append("ET")
+    stream = "\n".join(ops).encode("latin-1")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(bytes(out))
+
+
+def test_text_layer_rows_parse_like_ocr_output(tmp_path):
+    pdf_path = tmp_path / "statement.pdf"
+    _write_pdf(pdf_path, STATEMENT_LINES)
+
+    assert read_text_layer(str(pdf_path)) is not None
+
+    transactions = process_pdf(str(pdf_path))
+
+    assert [(t["date"], t["description"], t["amount"]) for t in transactions] == [
+        ("11/01/25", "KROGER #339 INDIANAPOLIS IN", 39.5),
+        ("11/02/25", "ABC*NATIONAL INSTITUTE F INDIANAPOLIS IN 317-274-3432", 1234.0),
+    ]